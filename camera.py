@@ -0,0 +1,106 @@
+"""Threaded camera capture for the hand controller.
+
+Frames are read, mirrored and converted to RGB on a background thread,
+so the next frame is already being prepared while the main loop runs
+hand detection on the current one, and the loop always gets the newest
+frame instead of a stale one.
+"""
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+
+class Camera:
+    """Reads frames from a cv2.VideoCapture on a background thread.
+
+    Each frame is delivered as a (bgr, rgb) pair of the mirrored image:
+    the full-resolution BGR frame for drawing and display, and the RGB one
+    for MediaPipe, shrunk by inference_scale.
+    """
+
+    def __init__(self, index: int = 0, width: int = 640, height: int = 480, inference_scale: float = 1.0):
+        if not 0 < inference_scale <= 1:
+            raise ValueError(f"inference_scale must be in (0, 1], got {inference_scale}")
+        self._inference_scale = inference_scale
+        self._capture = cv2.VideoCapture(index)
+        self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        # Keep the driver from queueing frames: a queued frame is already stale when read.
+        # Backends without this property ignore it.
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._condition = threading.Condition()
+        self._frame: Optional[Tuple[Any, Any]] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start capturing frames in the background."""
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+
+    def _capture_loop(self) -> None:
+        try:
+            while self._running:
+                ret, frame = self._capture.read()
+                if not ret:
+                    logger.warning("Camera stopped delivering frames")
+                    break
+                frames = self._prepare(frame)
+                with self._condition:
+                    # Unread frames are simply replaced: the consumer only wants the newest
+                    self._frame = frames
+                    self._condition.notify_all()
+        except Exception:
+            logger.exception("Camera capture failed")
+        finally:
+            # Always wake read(), or the main loop would wait forever on a dead thread
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+            # Released by this thread so it never races with a read() in progress
+            self._capture.release()
+
+    def _prepare(self, frame: Any) -> Tuple[Any, Any]:
+        """Mirror a captured frame and build the RGB copy used for detection."""
+        # Mirror the frame (selfie view): MediaPipe assigns handedness
+        # assuming a mirrored image, so labels match physical hands and
+        # the preview behaves like a mirror.
+        frame = cv2.flip(frame, 1)
+        small = frame
+        if self._inference_scale < 1:
+            # Landmarks are normalized, so detections on the smaller
+            # frame map onto the full-resolution one unchanged
+            small = cv2.resize(frame, None, fx=self._inference_scale, fy=self._inference_scale,
+                               interpolation=cv2.INTER_AREA)
+        return frame, cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+
+    def read(self) -> Optional[Tuple[Any, Any]]:
+        """Wait for a frame newer than the last one read and return its (bgr, rgb) pair.
+
+        Returns None once capture has stopped and no unread frame is left.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._frame is not None or not self._running)
+            frame, self._frame = self._frame, None
+            return frame
+
+    def release(self) -> None:
+        """Stop the capture thread and release the camera.
+
+        Once started, the capture thread releases the camera itself when it
+        exits, so a read() blocked in the driver is never torn down under it.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is None:
+            self._capture.release()
+            return
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            logger.warning("Camera thread still blocked in read; it will release the camera when it returns")
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field, fields, asdict
 import json
 import logging
 import os
-from typing import List, Type, TypeVar
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar, get_args, get_origin
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ class ConfigError(Exception):
     """Raised when the configuration file is missing or invalid."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ESP32Config:
     """ESP32 connection configuration."""
     ip: str = "esp32.local"
@@ -22,15 +22,18 @@ class ESP32Config:
     connection_timeout: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraConfig:
     """Camera configuration."""
     index: int = 0
     width: int = 640
     height: int = 480
+    # Scale factor (0-1] for the copy of each frame passed to hand detection;
+    # the preview keeps full resolution. 0.5 = a quarter of the pixels.
+    inference_scale: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HandDetectionConfig:
     """Hand detection configuration."""
     max_hands: int = 2
@@ -42,11 +45,15 @@ class HandDetectionConfig:
     # Horizontal tip-to-knuckle offset (normalized image coords) beyond which
     # the index finger counts as pointing left/right instead of straight.
     index_orientation_threshold: float = 0.05
+    # MediaPipe landmark model: 0 = lite (roughly twice as fast), 1 = full
+    model_complexity: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Display configuration."""
+    # Show the preview window; false runs headless (stop with Ctrl+C)
+    enabled: bool = True
     # Master toggle: disables every overlay (landmarks, text, status, FPS)
     show_overlays: bool = True
     show_landmarks: bool = True
@@ -60,7 +67,7 @@ class DisplayConfig:
     text_thickness: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class HandlerConfig:
     """Handler configuration."""
     buffer_size: int = 30
@@ -69,16 +76,90 @@ class HandlerConfig:
     refresh_interval: float = 0.5
 
 
-def _build_section(section_cls: Type[T], data: dict, section: str) -> T:
-    """Build a config section, warning about and ignoring unknown keys."""
-    valid = {f.name for f in fields(section_cls)}  # type: ignore[arg-type]
-    unknown = set(data) - valid
+# Config sections by JSON key
+_SECTIONS: Dict[str, Type[Any]] = {
+    'esp32': ESP32Config,
+    'camera': CameraConfig,
+    'hand_detection': HandDetectionConfig,
+    'display': DisplayConfig,
+    'handler': HandlerConfig,
+}
+
+# Expected JSON value type per section field, derived once from the dataclasses
+_FIELD_TYPES: Dict[str, Dict[str, Any]] = {
+    section: {f.name: f.type for f in fields(section_cls)}
+    for section, section_cls in _SECTIONS.items()
+}
+
+# Allowed values beyond the type, per section field: (predicate, description for errors)
+_FIELD_RANGES: Dict[str, Dict[str, Tuple[Callable[[Any], bool], str]]] = {
+    'esp32': {
+        'port': (lambda v: 1 <= v <= 65535, "between 1 and 65535"),
+    },
+    'camera': {
+        'inference_scale': (lambda v: 0 < v <= 1, "in the range (0, 1]"),
+    },
+    'hand_detection': {
+        'model_complexity': (lambda v: v in (0, 1), "0 or 1"),
+    },
+}
+
+
+def _is_type(value: Any, expected: type) -> bool:
+    if expected in (int, float):
+        # bool is an int subclass but never a valid number here; ints are valid floats
+        numeric = (int, float) if expected is float else (int,)
+        return isinstance(value, numeric) and not isinstance(value, bool)
+    return isinstance(value, expected)
+
+
+def _check_type(section: str, key: str, value: Any, expected: Any) -> None:
+    """Raise ConfigError if a value does not match its field's type.
+
+    Generic list fields (e.g. List[int]) also have every element checked.
+    """
+    origin = get_origin(expected)
+    if origin is None:
+        valid = _is_type(value, expected)
+        wanted, got = expected.__name__, type(value).__name__
+    else:
+        (item_type,) = get_args(expected)
+        wanted = f"{origin.__name__} of {item_type.__name__}"
+        got = type(value).__name__
+        valid = isinstance(value, origin)
+        if valid:
+            bad = [item for item in value if not _is_type(item, item_type)]
+            valid = not bad
+            if bad:
+                got = f"{origin.__name__} containing {type(bad[0]).__name__}"
+    if not valid:
+        raise ConfigError(f"Invalid value for '{section}.{key}': expected {wanted}, got {got}")
+
+
+def _build_section(section_cls: Type[T], data: Any, section: str) -> T:
+    """Build a config section, warning about and ignoring unknown keys.
+
+    Raises ConfigError if the section is not an object or a value has the
+    wrong type or is out of range.
+    """
+    if not isinstance(data, dict):
+        raise ConfigError(f"Config section '{section}' must be an object")
+    field_types = _FIELD_TYPES[section]
+    unknown = set(data) - set(field_types)
     if unknown:
         logger.warning("Ignoring unknown '%s' config keys: %s", section, ', '.join(sorted(unknown)))
-    return section_cls(**{k: v for k, v in data.items() if k in valid})
-
-
-@dataclass
+    ranges = _FIELD_RANGES.get(section, {})
+    for key, value in data.items():
+        if key in field_types:
+            _check_type(section, key, value, field_types[key])
+        if key in ranges:
+            in_range, allowed = ranges[key]
+            if not in_range(value):
+                raise ConfigError(f"Invalid value for '{section}.{key}': must be {allowed}, got {value!r}")
+    return section_cls(**{k: v for k, v in data.items() if k in field_types})
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration class."""
     esp32: ESP32Config = field(default_factory=ESP32Config)
@@ -89,14 +170,16 @@ class Config:
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Config':
-        """Create Config from dictionary."""
-        return cls(
-            esp32=_build_section(ESP32Config, data.get('esp32', {}), 'esp32'),
-            camera=_build_section(CameraConfig, data.get('camera', {}), 'camera'),
-            hand_detection=_build_section(HandDetectionConfig, data.get('hand_detection', {}), 'hand_detection'),
-            display=_build_section(DisplayConfig, data.get('display', {}), 'display'),
-            handler=_build_section(HandlerConfig, data.get('handler', {}), 'handler')
-        )
+        """Create Config from dictionary.
+
+        Raises ConfigError if the structure, a value type or a value range is invalid.
+        """
+        if not isinstance(data, dict):
+            raise ConfigError("Configuration must be a JSON object")
+        return cls(**{
+            section: _build_section(section_cls, data.get(section, {}), section)
+            for section, section_cls in _SECTIONS.items()
+        })
 
     @classmethod
     def from_file(cls, config_path: str = "config.json") -> 'Config':
@@ -116,8 +199,6 @@ class Config:
             return cls.from_dict(data)
         except json.JSONDecodeError as e:
             raise ConfigError(f"Invalid JSON in '{config_path}': {e}") from e
-        except TypeError as e:
-            raise ConfigError(f"Invalid configuration structure in '{config_path}': {e}") from e
 
     def to_dict(self) -> dict:
         """Convert Config to dictionary."""
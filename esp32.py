@@ -3,10 +3,16 @@ import logging
 import socket
 import threading
 import time
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# TCP keepalive probing (seconds idle, seconds between probes, probe count):
+# a silently dropped Wi-Fi link is detected in ~11s instead of hours
+_KEEPALIVE_IDLE = 5
+_KEEPALIVE_INTERVAL = 2
+_KEEPALIVE_COUNT = 3
+
 
 class Esp32(abc.ABC):
 
@@ -48,6 +54,8 @@ class TCPSender(Esp32):
         self.__reconnect_lock = threading.Lock()
         self.__reconnect_thread: Optional[threading.Thread] = None
         self._sock: Optional[socket.socket] = None
+        # Encoded wire frame per action code; the set of codes is small and fixed
+        self.__frames: Dict[str, bytes] = {}
 
     def connect(self) -> bool:
         """Create and connect the TCP socket. Returns True on success."""
@@ -55,6 +63,7 @@ class TCPSender(Esp32):
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(self.__connection_timeout)
         try:
+            self.__configure_socket(sock)
             sock.connect((self._ip, self._port))
         except OSError as e:
             logger.warning("Connection to %s:%s failed: %s", self._ip, self._port, e)
@@ -65,6 +74,24 @@ class TCPSender(Esp32):
         logger.info("Connected to %s:%s", self._ip, self._port)
         return True
 
+    @staticmethod
+    def __configure_socket(sock: socket.socket) -> None:
+        """Tune the socket for small, latency-sensitive frames on a flaky link."""
+        # Action frames are a few bytes; don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Probe timing options are platform specific (Linux; TCP_KEEPIDLE also on recent macOS)
+        for option, value in (("TCP_KEEPIDLE", _KEEPALIVE_IDLE),
+                              ("TCP_KEEPINTVL", _KEEPALIVE_INTERVAL),
+                              ("TCP_KEEPCNT", _KEEPALIVE_COUNT)):
+            if not hasattr(socket, option):
+                continue
+            # Best effort: faster dead-link detection is not worth refusing to connect over
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            except OSError as e:
+                logger.debug("Socket option %s not supported: %s", option, e)
+
     def send_action(self, action: str) -> bool:
         """Send an action, scheduling a reconnect if needed. Returns True if sent."""
         sock = self._sock
@@ -72,7 +99,7 @@ class TCPSender(Esp32):
             self.__schedule_reconnect()
             return False
         try:
-            sock.sendall((action + "\n").encode("utf-8"))
+            sock.sendall(self.__frame(action))
             self.__drain_replies(sock)
             return True
         except OSError as e:
@@ -80,6 +107,13 @@ class TCPSender(Esp32):
             self.close()
             return False
 
+    def __frame(self, action: str) -> bytes:
+        """Return the newline-terminated wire frame for an action, encoding it once."""
+        frame = self.__frames.get(action)
+        if frame is None:
+            frame = self.__frames[action] = (action + "\n").encode("utf-8")
+        return frame
+
     def __schedule_reconnect(self) -> None:
         """Start a throttled background reconnect attempt.
 
@@ -1,6 +1,6 @@
 import logging
 import mediapipe as mp
-import math
+import numpy as np
 from enum import Enum
 from typing import Any, Optional, List
 
@@ -13,7 +13,31 @@ mp_hands = mp.solutions.hands  # type: ignore[attr-defined]
 # Type aliases for MediaPipe types
 HandLandmarkList = Any
 Handedness = Any
-NormalizedLandmark = Any
+
+# Default border (normalized image coords) every landmark must stay inside
+_VISIBILITY_MARGIN = 0.01
+
+# Landmark indices as plain ints, resolved once instead of per lookup
+_WRIST = int(mp_hands.HandLandmark.WRIST)
+_INDEX_FINGER_TIP = int(mp_hands.HandLandmark.INDEX_FINGER_TIP)
+_INDEX_FINGER_MCP = int(mp_hands.HandLandmark.INDEX_FINGER_MCP)
+_MIDDLE_FINGER_MCP = int(mp_hands.HandLandmark.MIDDLE_FINGER_MCP)
+
+# Fingertip landmarks and the finger bases they are measured against in is_open()
+_FINGER_TIPS = np.array([
+    mp_hands.HandLandmark.THUMB_TIP,
+    mp_hands.HandLandmark.INDEX_FINGER_TIP,
+    mp_hands.HandLandmark.MIDDLE_FINGER_TIP,
+    mp_hands.HandLandmark.RING_FINGER_TIP,
+    mp_hands.HandLandmark.PINKY_TIP,
+], dtype=np.intp)
+_FINGER_BASES = np.array([
+    mp_hands.HandLandmark.THUMB_CMC,
+    mp_hands.HandLandmark.INDEX_FINGER_MCP,
+    mp_hands.HandLandmark.MIDDLE_FINGER_MCP,
+    mp_hands.HandLandmark.RING_FINGER_MCP,
+    mp_hands.HandLandmark.PINKY_MCP,
+], dtype=np.intp)
 
 
 class HandType(Enum):
@@ -31,31 +55,68 @@ class IndexOrientation(Enum):
 class Hand:
     """Represents a single detected hand and its properties."""
 
+    # Accessed many times per frame (and pooled by HandProcessor); slots keep it small and fast to access
+    __slots__ = ('handedness', 'landmarks', '_open_threshold_ratio', '_index_orientation_threshold',
+                 '_hand_size_sq_cache', '_points_cache', '_hand_type_cache', '_visible_cache')
+
     def __init__(self, handedness: Handedness, landmarks: HandLandmarkList,
                  open_threshold_ratio: float = 0.6, index_orientation_threshold: float = 0.05):
-        self.handedness = handedness
-        self.landmarks = landmarks
         self._open_threshold_ratio = open_threshold_ratio
         self._index_orientation_threshold = index_orientation_threshold
-        self._hand_size_cache: Optional[float] = None
-
-    @staticmethod
-    def _calculate_3d_distance(landmark1: NormalizedLandmark, landmark2: NormalizedLandmark) -> float:
-        """Calculate 3D Euclidean distance between two landmarks."""
-        return math.sqrt(
-            (landmark2.x - landmark1.x) ** 2 +
-            (landmark2.y - landmark1.y) ** 2 +
-            (landmark2.z - landmark1.z) ** 2
-        )
+        self.reload(handedness, landmarks)
+
+    def reload(self, handedness: Handedness, landmarks: HandLandmarkList) -> None:
+        """Point this Hand at a new detection, dropping all cached results.
+
+        Lets HandProcessor reuse Hand objects across frames instead of
+        allocating new ones.
+        """
+        self.handedness = handedness
+        self.landmarks = landmarks
+        self._hand_size_sq_cache: Optional[float] = None
+        self._points_cache: Optional[np.ndarray] = None
+        self._hand_type_cache: Optional[HandType] = None
+        self._visible_cache: Optional[bool] = None
 
-    def is_fully_visible(self, margin: float = 0.01) -> bool:
-        """Check if all landmarks are within normalized image bounds."""
+    def _points(self) -> np.ndarray:
+        """Landmarks as a (21, 3) float32 array of x, y, z, built once per hand.
+
+        Gesture checks then run as vectorized NumPy ops instead of reading
+        each landmark's attributes in Python.
+        """
+        if self._points_cache is None:
+            landmark = self.landmarks.landmark
+            # Single pass over the protobuf with a known size: no per-landmark tuples to convert
+            self._points_cache = np.fromiter(
+                (c for lm in landmark for c in (lm.x, lm.y, lm.z)), dtype=np.float32, count=3 * len(landmark)
+            ).reshape(-1, 3)
+        return self._points_cache
+
+    def is_fully_visible(self, margin: Optional[float] = None) -> bool:
+        """Check if all landmarks are within normalized image bounds.
+
+        The result for the default margin is cached.
+        """
+        if margin is None:
+            if self._visible_cache is None:
+                self._visible_cache = self.is_fully_visible(_VISIBILITY_MARGIN)
+            return self._visible_cache
         if not self.landmarks:
             return False
-        return all(margin <= lm.x <= 1 - margin and margin <= lm.y <= 1 - margin for lm in self.landmarks.landmark)
+        xy = self._points()[:, :2]
+        return bool(((xy >= margin) & (xy <= 1 - margin)).all())
 
     def get_hand_type(self) -> HandType:
-        """Get this hand's type (LEFT or RIGHT)."""
+        """Get this hand's type (LEFT or RIGHT).
+
+        Queried several times per frame (handler, drawer), so the result is
+        computed once and cached for the current detection; reload() clears it.
+        """
+        if self._hand_type_cache is None:
+            self._hand_type_cache = self._classify_hand_type()
+        return self._hand_type_cache
+
+    def _classify_hand_type(self) -> HandType:
         if not self.handedness or not self.is_fully_visible():
             return HandType.UNKNOWN
         if self.handedness.classification[0].score < 0.7:
@@ -70,39 +131,20 @@ class Hand:
         if not self.landmarks:
             return False
 
-        if self._hand_size_cache is None:
-            self._hand_size_cache = self._calculate_3d_distance(
-                self.landmarks.landmark[mp_hands.HandLandmark.WRIST],
-                self.landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-            )
+        # All distances are compared squared, so no square root is needed
+        points = self._points()
+        if self._hand_size_sq_cache is None:
+            size = points[_WRIST] - points[_MIDDLE_FINGER_MCP]
+            self._hand_size_sq_cache = float(size @ size)
 
-        hand_size = self._hand_size_cache
-        if hand_size < 1e-6:
-            logger.warning("Hand size too small (%s), cannot determine if open.", hand_size)
+        hand_size_sq = self._hand_size_sq_cache
+        if hand_size_sq < 1e-12:
+            logger.warning("Hand size too small (%s), cannot determine if open.", hand_size_sq ** 0.5)
             return False
 
-        finger_tips = [
-            mp_hands.HandLandmark.THUMB_TIP,
-            mp_hands.HandLandmark.INDEX_FINGER_TIP,
-            mp_hands.HandLandmark.MIDDLE_FINGER_TIP,
-            mp_hands.HandLandmark.RING_FINGER_TIP,
-            mp_hands.HandLandmark.PINKY_TIP,
-        ]
-        finger_mcps = [
-            mp_hands.HandLandmark.THUMB_CMC,
-            mp_hands.HandLandmark.INDEX_FINGER_MCP,
-            mp_hands.HandLandmark.MIDDLE_FINGER_MCP,
-            mp_hands.HandLandmark.RING_FINGER_MCP,
-            mp_hands.HandLandmark.PINKY_MCP,
-        ]
-
-        distances = [
-            self._calculate_3d_distance(self.landmarks.landmark[tip], self.landmarks.landmark[mcp])
-            for tip, mcp in zip(finger_tips, finger_mcps)
-        ]
-
-        normalized_distances = [d / hand_size for d in distances]
-        return all(d > threshold_ratio for d in normalized_distances)
+        diffs = points[_FINGER_TIPS] - points[_FINGER_BASES]
+        min_distance_sq = threshold_ratio * threshold_ratio * hand_size_sq
+        return bool((np.einsum('ij,ij->i', diffs, diffs) > min_distance_sq).all())
 
     def get_index_orientation(self, threshold: Optional[float] = None) -> IndexOrientation:
         """Get the orientation of the index finger.
@@ -115,9 +157,8 @@ class Hand:
         if not self.landmarks:
             raise ValueError("Hand landmarks not available.")
 
-        index_tip = self.landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_base = self.landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_MCP]
-        diff = index_tip.x - index_base.x
+        points = self._points()
+        diff = float(points[_INDEX_FINGER_TIP, 0] - points[_INDEX_FINGER_MCP, 0])
 
         if diff > threshold:
             return IndexOrientation.RIGHT
@@ -128,34 +169,57 @@ class Hand:
 
 
 class HandProcessor:
-    """Processes video frames to detect and analyze hand gestures."""
+    """Processes video frames to detect and analyze hand gestures.
+
+    Each instance owns its MediaPipe graph, which is not reentrant: call
+    process_frame() from one thread at a time, or use one processor per thread.
+    """
 
     def __init__(self, min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
                  max_hands: int = 2, open_threshold_ratio: float = 0.6,
-                 index_orientation_threshold: float = 0.05):
+                 index_orientation_threshold: float = 0.05, model_complexity: int = 0):
         self.hands_engine = mp_hands.Hands(
+            static_image_mode=False,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
             max_num_hands=max_hands
         )
         self._open_threshold_ratio = open_threshold_ratio
         self._index_orientation_threshold = index_orientation_threshold
+        # Hand objects reused across frames, grown on demand up to max_hands
+        self._hand_pool: List[Hand] = []
 
     def process_frame(self, rgb_frame: Any) -> List[Hand]:
-        """Processes a single RGB frame to find hands."""
-        results = self.hands_engine.process(rgb_frame)
-        detected_hands: List[Hand] = []
-
-        if results.multi_hand_landmarks:
-            for handedness, landmarks in zip(results.multi_handedness, results.multi_hand_landmarks):
-                detected_hands.append(Hand(
-                    handedness=handedness,
-                    landmarks=landmarks,
-                    open_threshold_ratio=self._open_threshold_ratio,
-                    index_orientation_threshold=self._index_orientation_threshold
-                ))
-
-        return detected_hands
+        """Processes a single RGB frame to find hands.
+
+        The returned Hand objects are pooled and reloaded by the next call,
+        so they are only valid until then.
+        """
+        # A read-only frame lets MediaPipe use the buffer without copying it;
+        # the caller's flag is restored afterwards (read-only views can't be made writable)
+        was_writeable = rgb_frame.flags.writeable
+        rgb_frame.flags.writeable = False
+        try:
+            results = self.hands_engine.process(rgb_frame)
+        finally:
+            if was_writeable:
+                rgb_frame.flags.writeable = True
+        if not results.multi_hand_landmarks:
+            return []
+
+        detections = list(zip(results.multi_handedness, results.multi_hand_landmarks))
+        while len(self._hand_pool) < len(detections):
+            self._hand_pool.append(Hand(
+                handedness=None,
+                landmarks=None,
+                open_threshold_ratio=self._open_threshold_ratio,
+                index_orientation_threshold=self._index_orientation_threshold
+            ))
+        for hand, (handedness, landmarks) in zip(self._hand_pool, detections):
+            hand.reload(handedness, landmarks)
+
+        return self._hand_pool[:len(detections)]
 
     def close(self) -> None:
         """Releases the MediaPipe hands engine."""
@@ -1,14 +1,56 @@
 import abc
 import collections
+import operator
 import time
 from enum import Enum
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from esp32 import Esp32
 from hand import Hand, HandType, IndexOrientation
 
 
+class _ActionBuffer:
+    """Fixed-size history of a hand's recent actions with running counts.
+
+    Counts are updated as actions enter and leave, so the majority lookup
+    costs O(distinct actions) instead of re-tallying the whole buffer
+    every frame.
+    """
+
+    def __init__(self, maxlen: int):
+        self._actions: collections.deque = collections.deque(maxlen=maxlen)
+        self._counts: collections.Counter = collections.Counter()
+
+    def append(self, action: Enum) -> None:
+        """Add an action, evicting (and uncounting) the oldest one when full."""
+        actions = self._actions
+        if len(actions) == actions.maxlen:
+            if not actions:
+                return  # zero-size buffer keeps no history
+            evicted = actions[0]
+            self._counts[evicted] -= 1
+            if not self._counts[evicted]:
+                del self._counts[evicted]
+        actions.append(action)
+        self._counts[action] += 1
+
+    def most_common(self) -> Optional[Tuple[Enum, int]]:
+        """The most frequent action and its count, or None when empty."""
+        if not self._counts:
+            return None
+        return max(self._counts.items(), key=operator.itemgetter(1))
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __getitem__(self, index: int) -> Enum:
+        return self._actions[index]
+
+
 class Handler(abc.ABC):
+    # Consecutive frames a changed (non-priority) action must persist before it is sent
+    _CONFIRM_FRAMES = 2
+
     def __init__(self, esp32: Esp32, buffer_size: int = 30, refresh_interval: float = 0.5):
         self._esp32_connector = esp32
         self._refresh_interval = refresh_interval
@@ -20,9 +62,13 @@ class Handler(abc.ABC):
             HandType.LEFT: 0.0,
             HandType.RIGHT: 0.0,
         }
-        self._action_buffers: Dict[HandType, collections.deque] = {
-            HandType.LEFT: collections.deque(maxlen=buffer_size),
-            HandType.RIGHT: collections.deque(maxlen=buffer_size),
+        self._pending_actions: Dict[HandType, Tuple[Optional[Enum], int]] = {
+            HandType.LEFT: (None, 0),
+            HandType.RIGHT: (None, 0),
+        }
+        self._action_buffers: Dict[HandType, _ActionBuffer] = {
+            HandType.LEFT: _ActionBuffer(buffer_size),
+            HandType.RIGHT: _ActionBuffer(buffer_size),
         }
 
     @abc.abstractmethod
@@ -30,6 +76,25 @@ class Handler(abc.ABC):
         """Process a list of detected hands, send actions, and return them."""
         pass
 
+    def _debounce(self, hand_type: HandType, action: Enum) -> Enum:
+        """Hold back a changed action until it persists for _CONFIRM_FRAMES frames.
+
+        At a gesture boundary the majority vote can flip between two actions
+        frame to frame; without this each flip would be sent to the ESP32.
+        Priority actions (STOP) and the first action always pass immediately.
+        Returns the action that is in effect for this frame.
+        """
+        last = self._last_actions[hand_type]
+        if last is None or action == last or self._is_priority_action(action):
+            self._pending_actions[hand_type] = (None, 0)
+            return action
+        pending, count = self._pending_actions[hand_type]
+        count = count + 1 if pending == action else 1
+        # Stays pending once confirmed: it is only cleared when the send succeeds
+        # (action == last) or the action changes, so a failed send keeps retrying
+        self._pending_actions[hand_type] = (action, count)
+        return action if count >= self._CONFIRM_FRAMES else last
+
     def _should_send(self, hand_type: HandType, action: Enum) -> bool:
         """Send when the action changed, or periodically as a keepalive refresh.
 
@@ -54,17 +119,18 @@ class Handler(abc.ABC):
         action = self._get_action(hand)
         if self._is_priority_action(action):
             return action
-        majority = self._majority_action(hand)
+        majority = self._majority_action(hand.get_hand_type())
         return majority if majority is not None else action
 
     def _record_action(self, hand: Hand) -> Enum:
         """Record the hand's current action in its buffer and return the smoothed action."""
         action = self._get_action(hand)
         hand_type = hand.get_hand_type()
-        if hand_type in self._action_buffers:
-            self._action_buffers[hand_type].append(action)
+        buffer = self._action_buffers.get(hand_type)
+        if buffer is not None:
+            buffer.append(action)
             if not self._is_priority_action(action):
-                majority = self._majority_action(hand)
+                majority = self._majority_action(hand_type)
                 if majority is not None:
                     return majority
         return action
@@ -80,20 +146,18 @@ class Handler(abc.ABC):
         when there is no buffered history for the hand type.
         """
         buffer = self._action_buffers.get(hand_type)
-        if not buffer:
+        if buffer is None:
             return None
-        _, count = collections.Counter(buffer).most_common(1)[0]
-        return count / len(buffer)
-
-    def _majority_action(self, hand: Hand) -> Optional[Enum]:
-        hand_type = hand.get_hand_type()
-        if hand_type not in self._action_buffers:
+        most_common = buffer.most_common()
+        if most_common is None:
             return None
-        counter = collections.Counter(self._action_buffers[hand_type])
-        most_common = counter.most_common(1)
-        if most_common:
-            return most_common[0][0]
-        return None
+        return most_common[1] / len(buffer)
+
+    def _majority_action(self, hand_type: HandType) -> Optional[Enum]:
+        """The most frequent action in this hand type's buffer, if any."""
+        buffer = self._action_buffers.get(hand_type)
+        most_common = buffer.most_common() if buffer is not None else None
+        return most_common[0] if most_common is not None else None
 
     @abc.abstractmethod
     def _get_action(self, hand: Hand) -> Enum:
@@ -109,6 +173,13 @@ class CarAction(Enum):
 
 
 class CarHandler(Handler):
+    # Steering action for each right-hand index finger orientation
+    _DIRECTION_ACTIONS: Dict[IndexOrientation, CarAction] = {
+        IndexOrientation.LEFT: CarAction.DIRECTION_LEFT,
+        IndexOrientation.RIGHT: CarAction.DIRECTION_RIGHT,
+        IndexOrientation.STRAIGHT: CarAction.DIRECTION_STRAIGHT,
+    }
+
     def __init__(self, esp32: Esp32, buffer_size: int = 30, refresh_interval: float = 0.5):
         super().__init__(esp32, buffer_size, refresh_interval)
         # Default actions when hands are not detected
@@ -122,7 +193,11 @@ class CarHandler(Handler):
         Determine car actions based on hand detections.
         If  it does not detect the 2 hands, stops
         """
-        detected = {h.get_hand_type(): h for h in hands if h.get_hand_type() != HandType.UNKNOWN}
+        detected: Dict[HandType, Hand] = {}
+        for hand in hands:
+            hand_type = hand.get_hand_type()
+            if hand_type != HandType.UNKNOWN:
+                detected[hand_type] = hand
         both = HandType.LEFT in detected and HandType.RIGHT in detected
 
         return {
@@ -132,7 +207,10 @@ class CarHandler(Handler):
 
     def process_hands(self, hands: List[Hand]) -> Dict[HandType, Enum]:
         """Process a list of detected hands and send actions for car control."""
-        actions: Dict[HandType, Enum] = dict(self.__determine_actions(hands))
+        actions: Dict[HandType, Enum] = {
+            hand_type: self._debounce(hand_type, action)
+            for hand_type, action in self.__determine_actions(hands).items()
+        }
         for hand_type, action in actions.items():
             if self._should_send(hand_type, action):
                 self._send_action(hand_type, action)
@@ -167,12 +245,6 @@ class CarHandler(Handler):
             return CarAction.ACCELERATE if hand.is_open() else CarAction.STOP
 
         elif hand_type == HandType.RIGHT:
-            orientation = hand.get_index_orientation()
-            if orientation == IndexOrientation.LEFT:
-                return CarAction.DIRECTION_LEFT
-            elif orientation == IndexOrientation.RIGHT:
-                return CarAction.DIRECTION_RIGHT
-            else:
-                return CarAction.DIRECTION_STRAIGHT
+            return self._DIRECTION_ACTIONS[hand.get_index_orientation()]
 
         return CarAction.STOP
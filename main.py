@@ -5,6 +5,7 @@ import time
 import cv2
 import esp32
 import handlers
+from camera import Camera
 from config import Config, ConfigError
 from draw import Drawer
 from hand import HandProcessor
@@ -22,10 +23,10 @@ def main() -> None:
         logger.error("%s", e)
         sys.exit(1)
 
-    # Initialize video capture with config
-    cap = cv2.VideoCapture(config.camera.index)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.camera.width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.camera.height)
+    # Initialize video capture with config; frames are read, mirrored and
+    # converted on a background thread so this work overlaps with hand detection
+    camera = Camera(config.camera.index, config.camera.width, config.camera.height,
+                    config.camera.inference_scale)
 
     # Initialize hand processor
     hand_processor = HandProcessor(
@@ -33,7 +34,8 @@ def main() -> None:
         min_tracking_confidence=config.hand_detection.min_tracking_confidence,
         max_hands=config.hand_detection.max_hands,
         open_threshold_ratio=config.hand_detection.open_threshold_ratio,
-        index_orientation_threshold=config.hand_detection.index_orientation_threshold
+        index_orientation_threshold=config.hand_detection.index_orientation_threshold,
+        model_complexity=config.hand_detection.model_complexity
     )
 
     # Initialize ESP32 client with config
@@ -55,18 +57,13 @@ def main() -> None:
     drawer = Drawer(config.display)
 
     prev_time = time.monotonic()
+    camera.start()
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret:
+            frames = camera.read()
+            if frames is None:
                 break
-
-            # Mirror the frame (selfie view): MediaPipe assigns handedness
-            # assuming a mirrored image, so labels match physical hands and
-            # the preview behaves like a mirror.
-            frame = cv2.flip(frame, 1)
-
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame, rgb_frame = frames
 
             # Process the frame to find hands
             detected_hands = hand_processor.process_frame(rgb_frame)
@@ -74,6 +71,9 @@ def main() -> None:
             # Let the handler determine and send actions
             actions = handler.process_hands(detected_hands)
 
+            if not config.display.enabled:
+                continue
+
             now = time.monotonic()
             fps = 1.0 / max(now - prev_time, 1e-6)
             prev_time = now
@@ -86,9 +86,13 @@ def main() -> None:
             cv2.imshow(config.display.window_name, frame)
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
+    except KeyboardInterrupt:
+        # The way to stop in headless mode, where there is no window to press 'q' in
+        pass
     finally:
-        cap.release()
-        cv2.destroyAllWindows()
+        camera.release()
+        if config.display.enabled:
+            cv2.destroyAllWindows()
         client_esp32.close()
         hand_processor.close()
 
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from camera import Camera
+
+
+class TestCamera(unittest.TestCase):
+
+    @patch('camera.cv2.VideoCapture')
+    def test_frames_are_read_in_background_until_stream_ends(self, mock_capture_cls):
+        capture = mock_capture_cls.return_value
+        raw = np.zeros((2, 2, 3), dtype=np.uint8)
+        raw[0, 0] = (255, 0, 0)  # blue pixel (BGR) in the top-left corner
+        capture.read.side_effect = [(True, raw), (False, None)]
+
+        camera = Camera(index=0)
+        camera.start()
+        try:
+            # Frames arrive mirrored, as a BGR/RGB pair; after the stream ends read() returns None
+            frame, rgb_frame = camera.read()
+            self.assertEqual(tuple(frame[0, 1]), (255, 0, 0))
+            self.assertEqual(tuple(rgb_frame[0, 1]), (0, 0, 255))
+            self.assertIsNone(camera.read())
+        finally:
+            camera.release()
+        capture.release.assert_called_once()
+
+    @patch('camera.cv2.cvtColor', side_effect=RuntimeError("conversion failed"))
+    @patch('camera.cv2.VideoCapture')
+    def test_capture_error_ends_stream(self, mock_capture_cls, _mock_cvt):
+        capture = mock_capture_cls.return_value
+        capture.read.return_value = (True, np.zeros((2, 2, 3), dtype=np.uint8))
+
+        camera = Camera(index=0)
+        with self.assertLogs('camera', level='ERROR'):
+            camera.start()
+            # read() must not block forever once the capture thread has died
+            self.assertIsNone(camera.read())
+            camera.release()
+        capture.release.assert_called_once()
+
+    @patch('camera.cv2.VideoCapture')
+    def test_inference_frame_is_downscaled(self, mock_capture_cls):
+        capture = mock_capture_cls.return_value
+        capture.read.side_effect = [(True, np.zeros((480, 640, 3), dtype=np.uint8)), (False, None)]
+
+        camera = Camera(index=0, inference_scale=0.5)
+        camera.start()
+        try:
+            frame, rgb_frame = camera.read()
+            self.assertEqual(frame.shape, (480, 640, 3))
+            self.assertEqual(rgb_frame.shape, (240, 320, 3))
+        finally:
+            camera.release()
+
+    @patch('camera.cv2.VideoCapture')
+    def test_capture_is_configured(self, mock_capture_cls):
+        Camera(index=1, width=320, height=240)
+        mock_capture_cls.assert_called_once_with(1)
+        set_calls = [call.args for call in mock_capture_cls.return_value.set.call_args_list]
+        self.assertIn((cv2.CAP_PROP_FRAME_WIDTH, 320), set_calls)
+        self.assertIn((cv2.CAP_PROP_FRAME_HEIGHT, 240), set_calls)
+        self.assertIn((cv2.CAP_PROP_BUFFERSIZE, 1), set_calls)
@@ -1,12 +1,8 @@
 import unittest
 import tempfile
-import sys
 import os
 
-# Add the root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from config import Config, ConfigError  # noqa: E402
+from config import Config, ConfigError
 
 
 class TestConfig(unittest.TestCase):
@@ -24,6 +20,44 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.esp32.ip, 'car.local')
         self.assertFalse(hasattr(config.esp32, 'action_cooldown'))
 
+    def test_wrong_value_type_raises_config_error(self):
+        with self.assertRaisesRegex(ConfigError, r"esp32\.port"):
+            Config.from_dict({'esp32': {'port': '1234'}})
+        with self.assertRaisesRegex(ConfigError, r"display\.show_fps"):
+            Config.from_dict({'display': {'show_fps': 'yes'}})
+        with self.assertRaisesRegex(ConfigError, r"camera\.index"):
+            Config.from_dict({'camera': {'index': True}})
+
+    def test_list_elements_are_type_checked(self):
+        with self.assertRaisesRegex(ConfigError, r"display\.left_hand_color.*list of int"):
+            Config.from_dict({'display': {'left_hand_color': [0, "x", None]}})
+        with self.assertRaisesRegex(ConfigError, r"display\.right_hand_color"):
+            Config.from_dict({'display': {'right_hand_color': "red"}})
+        config = Config.from_dict({'display': {'left_hand_color': [255, 0, 0]}})
+        self.assertEqual(config.display.left_hand_color, [255, 0, 0])
+
+    def test_out_of_range_value_raises_config_error(self):
+        for port in (0, -5, 65536):
+            with self.assertRaisesRegex(ConfigError, r"esp32\.port"):
+                Config.from_dict({'esp32': {'port': port}})
+        for scale in (0, -0.5, 1.5):
+            with self.assertRaisesRegex(ConfigError, r"camera\.inference_scale"):
+                Config.from_dict({'camera': {'inference_scale': scale}})
+        with self.assertRaisesRegex(ConfigError, r"hand_detection\.model_complexity"):
+            Config.from_dict({'hand_detection': {'model_complexity': 7}})
+        config = Config.from_dict({'camera': {'inference_scale': 1}, 'hand_detection': {'model_complexity': 1}})
+        self.assertEqual(config.hand_detection.model_complexity, 1)
+
+    def test_non_object_section_raises_config_error(self):
+        with self.assertRaises(ConfigError):
+            Config.from_dict({'handler': [30]})
+        with self.assertRaises(ConfigError):
+            Config.from_dict([])
+
+    def test_int_accepted_for_float_fields(self):
+        config = Config.from_dict({'handler': {'refresh_interval': 1}})
+        self.assertEqual(config.handler.refresh_interval, 1)
+
     def test_missing_file_raises_config_error(self):
         with self.assertRaises(ConfigError):
             Config.from_file(os.path.join(tempfile.gettempdir(), 'does-not-exist.json'))
@@ -41,7 +75,3 @@ class TestConfig(unittest.TestCase):
     def test_round_trip_through_dict(self):
         config = Config()
         self.assertEqual(Config.from_dict(config.to_dict()), config)
-
-
-if __name__ == '__main__':
-    unittest.main()
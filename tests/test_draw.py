@@ -1,15 +1,10 @@
 import unittest
 from unittest.mock import Mock, patch
-import sys
-import os
 
-# Add the root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from config import DisplayConfig  # noqa: E402
-from draw import Drawer  # noqa: E402
-from hand import Hand, HandType  # noqa: E402
-from handlers import CarAction  # noqa: E402
+from config import DisplayConfig
+from draw import Drawer
+from hand import Hand, HandType
+from handlers import CarAction
 
 
 class TestDrawer(unittest.TestCase):
@@ -135,7 +130,3 @@ class TestDrawer(unittest.TestCase):
         colors = [call.args[5] for call in mock_put_text.call_args_list]
         self.assertIn((10, 20, 30), colors)
         self.assertIn((40, 50, 60), colors)
-
-
-if __name__ == '__main__':
-    unittest.main()
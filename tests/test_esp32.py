@@ -1,13 +1,9 @@
 import unittest
 import socket
 import time
-import sys
-import os
+from unittest.mock import patch
 
-# Add the root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from esp32 import TCPSender  # noqa: E402
+from esp32 import TCPSender
 
 
 def closed_port() -> int:
@@ -25,6 +21,24 @@ class TestTCPSenderOffline(unittest.TestCase):
         self.assertFalse(sender.connect())
         self.assertFalse(sender.is_connected())
 
+    @patch('esp32.socket.socket')
+    def test_rejected_keepalive_timing_still_connects(self, mock_socket_cls):
+        """Keepalive probe timing is optional: a platform rejecting it must not block connecting."""
+        keepalive_timing = {getattr(socket, name) for name in ("TCP_KEEPIDLE", "TCP_KEEPINTVL", "TCP_KEEPCNT")
+                            if hasattr(socket, name)}
+
+        def setsockopt(level, option, value):
+            if level == socket.IPPROTO_TCP and option in keepalive_timing:
+                raise OSError("Protocol not available")
+
+        sock = mock_socket_cls.return_value
+        sock.setsockopt.side_effect = setsockopt
+        # socket.socket is mocked, so no real port is needed
+        sender = TCPSender(ip="127.0.0.1", port=1234, connection_timeout=1)
+        self.assertTrue(sender.connect())
+        sock.connect.assert_called_once_with(("127.0.0.1", 1234))
+        sock.close.assert_not_called()
+
     def test_send_without_connection_returns_false(self):
         """Sending while disconnected fails gracefully instead of raising."""
         sender = TCPSender(ip="127.0.0.1", port=closed_port(), connection_timeout=1, reconnect_interval=3600)
@@ -51,6 +65,16 @@ class TestTCPSenderWithServer(unittest.TestCase):
         self.assertEqual(conn.recv(16), b"001\n")
         conn.close()
 
+    def test_nagle_is_disabled(self):
+        """Small action frames must be sent immediately, not coalesced."""
+        self.assertTrue(self.sender.connect())
+        self.assertTrue(self.sender._sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_keepalive_is_enabled(self):
+        """Dead links are detected by TCP keepalive even while no action changes."""
+        self.assertTrue(self.sender.connect())
+        self.assertTrue(self.sender._sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+
     def test_replies_are_drained_without_breaking_sends(self):
         """Pending ESP32 replies are consumed so the receive buffer never fills."""
         self.assertTrue(self.sender.connect())
@@ -86,7 +110,3 @@ class TestTCPSenderWithServer(unittest.TestCase):
         conn2, _ = self.server.accept()
         self.assertEqual(conn2.recv(16), b"111\n")
         conn2.close()
-
-
-if __name__ == '__main__':
-    unittest.main()
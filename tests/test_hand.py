@@ -1,13 +1,9 @@
 import unittest
-from unittest.mock import Mock
-import sys
-import os
+from unittest.mock import Mock, patch
 
-# Add the root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from hand import Hand, HandType, IndexOrientation  # noqa: E402
-import mediapipe as mp  # noqa: E402
+from hand import Hand, HandProcessor, HandType, IndexOrientation
+import mediapipe as mp
+import numpy as np
 
 mp_hands = mp.solutions.hands  # type: ignore[attr-defined]
 
@@ -51,6 +47,32 @@ class TestHand(unittest.TestCase):
         hand_left = self.create_mock_hand(landmarks_data, hand_label="Left")
         self.assertEqual(hand_left.get_hand_type(), HandType.LEFT)
 
+    def test_get_hand_type_is_cached(self):
+        """The hand type is classified once per Hand, then reused."""
+        hand = self.create_mock_hand([(0.5, 0.5, 0)] * 21, hand_label="Left")
+        self.assertEqual(hand.get_hand_type(), HandType.LEFT)
+
+        hand.handedness.classification[0].label = "Right"
+        self.assertEqual(hand.get_hand_type(), HandType.LEFT)
+
+    def test_reload_drops_cached_results(self):
+        """A reused (pooled) Hand reflects its new detection, not stale caches."""
+        hand = self.create_mock_hand([(0.5, 0.5, 0)] * 21, hand_label="Left")
+        self.assertEqual(hand.get_hand_type(), HandType.LEFT)
+
+        right = self.create_mock_hand([(0.5, 0.5, 0)] * 20 + [(0.0, 0.5, 0)], hand_label="Right")
+        hand.reload(right.handedness, right.landmarks)
+        self.assertFalse(hand.is_fully_visible())
+        self.assertEqual(hand.get_hand_type(), HandType.UNKNOWN)
+
+    def test_is_fully_visible(self):
+        """Landmarks near the border only count as visible with a smaller margin."""
+        landmarks_data = [(0.5, 0.5, 0)] * 20 + [(0.005, 0.5, 0)]
+        hand = self.create_mock_hand(landmarks_data)
+        self.assertFalse(hand.is_fully_visible())
+        self.assertTrue(hand.is_fully_visible(margin=0.001))
+        self.assertEqual(hand.get_hand_type(), HandType.UNKNOWN)
+
     def test_is_open(self):
         """Test the is_open logic with a clearly open hand."""
         landmarks_data = [(0.0, 0.0, 0.0)] * 21
@@ -143,5 +165,51 @@ class TestHand(unittest.TestCase):
         self.assertEqual(hand_pointing_straight.get_index_orientation(), IndexOrientation.STRAIGHT)
 
 
-if __name__ == '__main__':
-    unittest.main()
+class TestHandProcessor(unittest.TestCase):
+
+    def make_results(self, labels):
+        """Fake MediaPipe results with one centered hand per label."""
+        results = Mock()
+        results.multi_handedness = []
+        results.multi_hand_landmarks = []
+        for label in labels:
+            classification = Mock(label=label, score=0.9)
+            results.multi_handedness.append(Mock(classification=[classification]))
+            results.multi_hand_landmarks.append(
+                MockLandmarkList([MockLandmark(0.5, 0.5, 0.0) for _ in range(21)]))
+        return results
+
+    @patch.object(mp_hands, 'Hands')
+    def test_hands_are_pooled_across_frames(self, mock_hands_cls):
+        engine = mock_hands_cls.return_value
+        processor = HandProcessor()
+
+        engine.process.return_value = self.make_results(["Left", "Right"])
+        first = processor.process_frame(Mock())
+        self.assertEqual([h.get_hand_type() for h in first], [HandType.LEFT, HandType.RIGHT])
+
+        # The next frame reuses the same objects, reloaded with the new detections
+        engine.process.return_value = self.make_results(["Right"])
+        second = processor.process_frame(Mock())
+        self.assertEqual(len(second), 1)
+        self.assertIs(second[0], first[0])
+        self.assertEqual(second[0].get_hand_type(), HandType.RIGHT)
+
+        engine.process.return_value = self.make_results([])
+        self.assertEqual(processor.process_frame(Mock()), [])
+
+    @patch.object(mp_hands, 'Hands')
+    def test_frame_writeable_flag_is_restored(self, mock_hands_cls):
+        mock_hands_cls.return_value.process.return_value = self.make_results(["Left"])
+        processor = HandProcessor()
+
+        frame = np.zeros((2, 2, 3), dtype=np.uint8)
+        processor.process_frame(frame)
+        self.assertTrue(frame.flags.writeable)
+
+        # A read-only view stays read-only, and its detections are still returned
+        view = frame.view()
+        view.flags.writeable = False
+        frame.flags.writeable = False
+        self.assertEqual(len(processor.process_frame(view)), 1)
+        self.assertFalse(view.flags.writeable)
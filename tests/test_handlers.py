@@ -1,25 +1,50 @@
 import unittest
-from unittest.mock import Mock
-import sys
-import os
+from collections import deque
+from itertools import repeat
+from unittest.mock import Mock, call
 
-# Add the root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from handlers import CarHandler, CarAction
+from hand import Hand, HandType, IndexOrientation
 
-from handlers import CarHandler, CarAction  # noqa: E402
-from hand import Hand, HandType, IndexOrientation  # noqa: E402
+# Wire codes expected on the mock ESP32
+ACCEL = CarAction.ACCELERATE.value
+STOP = CarAction.STOP.value
+DIR_L = CarAction.DIRECTION_LEFT.value
+DIR_R = CarAction.DIRECTION_RIGHT.value
+DIR_S = CarAction.DIRECTION_STRAIGHT.value
 
 
 class TestCarHandler(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the canonical mock hands once; they only stub return values."""
+        cls.LEFT_OPEN = cls.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        cls.LEFT_CLOSED = cls.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
+        cls.RIGHT_LEFT = cls.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.LEFT)
+        cls.RIGHT_RIGHT = cls.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.RIGHT)
+        cls.RIGHT_STRAIGHT = cls.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        cls.UNKNOWN_HAND = cls.create_mock_hand(HandType.UNKNOWN, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        cls.shared_esp32 = Mock()
+
     def setUp(self):
-        """Set up a mock ESP32 connector and the CarHandler."""
-        self.mock_esp32 = Mock()
+        """Reset the shared mock ESP32 connector and set up the CarHandler."""
+        self.mock_esp32 = self.shared_esp32
+        # reset_mock() keeps return values, and some tests make sends fail
+        self.mock_esp32.reset_mock()
         self.mock_esp32.send_action.return_value = True
-        # Large refresh interval so tests only observe change-driven sends
-        self.handler = CarHandler(self.mock_esp32, refresh_interval=3600)
+        self.handler = self.make_handler()
+
+    def make_handler(self, **kwargs):
+        """Build a CarHandler on the mock ESP32.
 
-    def create_mock_hand(self, hand_type, is_open, orientation):
+        The refresh interval defaults to an hour so tests only observe change-driven sends.
+        """
+        kwargs.setdefault('refresh_interval', 3600)
+        return CarHandler(self.mock_esp32, **kwargs)
+
+    @staticmethod
+    def create_mock_hand(hand_type, is_open, orientation):
         """Helper to create a mock Hand object with specific properties."""
         mock_hand = Mock(spec=Hand)
         mock_hand.get_hand_type.return_value = hand_type
@@ -27,60 +52,63 @@ class TestCarHandler(unittest.TestCase):
         mock_hand.get_index_orientation.return_value = orientation
         return mock_hand
 
+    @staticmethod
+    def _feed(handler, hand, n):
+        """Record n frames of the given hand's action into the handler's buffer."""
+        # Consume the map without keeping the returned actions
+        deque(map(handler._record_action, repeat(hand, n)), maxlen=0)
+
     def test_left_hand_accelerate(self):
         """Test that an open left hand triggers ACCELERATE."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        right_hand = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        self.handler.process_hands([left_hand_open, right_hand])
+        self.handler.process_hands([self.LEFT_OPEN, self.RIGHT_STRAIGHT])
         # It should send ACCELERATE for the left hand and STRAIGHT for the right hand
-        self.mock_esp32.send_action.assert_any_call(CarAction.ACCELERATE.value)
-        self.mock_esp32.send_action.assert_any_call(CarAction.DIRECTION_STRAIGHT.value)
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
+        self.assertCountEqual(
+            self.mock_esp32.send_action.call_args_list,
+            [call(ACCEL), call(DIR_S)],
+        )
 
     def test_left_hand_stop(self):
         """Test that a closed left hand triggers STOP."""
-        left_hand_closed = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
-        right_hand = self.create_mock_hand(HandType.RIGHT, is_open=False, orientation=IndexOrientation.STRAIGHT)
-        self.handler.process_hands([left_hand_closed, right_hand])
-        self.mock_esp32.send_action.assert_any_call(CarAction.STOP.value)
-        self.mock_esp32.send_action.assert_any_call(CarAction.DIRECTION_STRAIGHT.value)
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
-
-    def test_right_hand_direction_right(self):
-        """Test right hand direction controls: RIGHT orientation."""
-        right_hand_right = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.RIGHT)
-        left_hand = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.LEFT)
-        self.handler.process_hands([right_hand_right, left_hand])
-        self.mock_esp32.send_action.assert_any_call(CarAction.STOP.value)
-        self.mock_esp32.send_action.assert_any_call(CarAction.DIRECTION_RIGHT.value)
-
-    def test_right_hand_direction_left(self):
-        """Test right hand direction controls: LEFT orientation."""
-        right_hand_left = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.LEFT)
-        left_hand = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.LEFT)
-        self.handler.process_hands([right_hand_left, left_hand])
-        self.mock_esp32.send_action.assert_any_call(CarAction.STOP.value)
-        self.mock_esp32.send_action.assert_any_call(CarAction.DIRECTION_LEFT.value)
+        self.handler.process_hands([self.LEFT_CLOSED, self.RIGHT_STRAIGHT])
+        self.assertCountEqual(
+            self.mock_esp32.send_action.call_args_list,
+            [call(STOP), call(DIR_S)],
+        )
+
+    def test_right_hand_direction(self):
+        """Test right hand direction controls for each index orientation."""
+        cases = [
+            (self.RIGHT_RIGHT, CarAction.DIRECTION_RIGHT),
+            (self.RIGHT_LEFT, CarAction.DIRECTION_LEFT),
+            (self.RIGHT_STRAIGHT, CarAction.DIRECTION_STRAIGHT),
+        ]
+        for right_hand, expected in cases:
+            with self.subTest(expected=expected):
+                # Fresh handler and mock per case: unchanged actions are not resent
+                self.mock_esp32.reset_mock()
+                handler = self.make_handler()
+                handler.process_hands([right_hand, self.LEFT_CLOSED])
+                sent = {c.args[0] for c in self.mock_esp32.send_action.call_args_list}
+                self.assertIn(STOP, sent)
+                self.assertIn(expected.value, sent)
 
     def test_no_hands(self):
         """Test that no hands triggers STOP and DIRECTION_STRAIGHT."""
         self.handler.process_hands([])
-        self.mock_esp32.send_action.assert_any_call(CarAction.STOP.value)
-        self.mock_esp32.send_action.assert_any_call(CarAction.DIRECTION_STRAIGHT.value)
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
+        self.assertCountEqual(
+            self.mock_esp32.send_action.call_args_list,
+            [call(STOP), call(DIR_S)],
+        )
 
     def test_process_hands_returns_actions(self):
         """Test that process_hands returns the actions it determined."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        right_hand_right = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.RIGHT)
-        actions = self.handler.process_hands([left_hand_open, right_hand_right])
+        actions = self.handler.process_hands([self.LEFT_OPEN, self.RIGHT_RIGHT])
         self.assertEqual(actions[HandType.LEFT], CarAction.ACCELERATE)
         self.assertEqual(actions[HandType.RIGHT], CarAction.DIRECTION_RIGHT)
 
     def test_single_hand_uses_defaults_and_keeps_buffers_clean(self):
         """Test that with only one hand detected, defaults are used and buffers stay empty."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        actions = self.handler.process_hands([left_hand_open])
+        actions = self.handler.process_hands([self.LEFT_OPEN])
         self.assertEqual(actions[HandType.LEFT], CarAction.STOP)
         self.assertEqual(actions[HandType.RIGHT], CarAction.DIRECTION_STRAIGHT)
         self.assertEqual(len(self.handler._action_buffers[HandType.LEFT]), 0)
@@ -88,63 +116,103 @@ class TestCarHandler(unittest.TestCase):
 
     def test_action_sent_only_once_when_unchanged(self):
         """Test that the same actions are not sent repeatedly."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        send = self.mock_esp32.send_action
 
         # First call should send actions
-        self.handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
+        self.handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 2)
 
         # Subsequent calls with the same state should not send more actions
-        self.handler.process_hands([left_hand_open])
-        self.handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
+        for _ in range(2):
+            self.handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 2)
+
+    def test_changed_action_sent_after_consecutive_frames(self):
+        """A new steering action must persist for two frames before it is sent."""
+        send = self.mock_esp32.send_action
+        handler = self.make_handler(buffer_size=1)
+
+        handler.process_hands([self.LEFT_OPEN, self.RIGHT_STRAIGHT])
+        send.reset_mock()
+
+        # A single flipped frame is held back and reported as the current action
+        actions = handler.process_hands([self.LEFT_OPEN, self.RIGHT_LEFT])
+        self.assertEqual(actions[HandType.RIGHT], CarAction.DIRECTION_STRAIGHT)
+        send.assert_not_called()
+
+        # Confirmed on the next frame
+        actions = handler.process_hands([self.LEFT_OPEN, self.RIGHT_LEFT])
+        self.assertEqual(actions[HandType.RIGHT], CarAction.DIRECTION_LEFT)
+        send.assert_called_once_with(DIR_L)
+
+    def test_confirmed_action_retried_while_sends_fail(self):
+        """A confirmed change stays in effect and is retried every frame until a send succeeds."""
+        send = self.mock_esp32.send_action
+        handler = self.make_handler(buffer_size=1)
+
+        handler.process_hands([self.LEFT_OPEN, self.RIGHT_STRAIGHT])
+        send.reset_mock()
+        send.return_value = False
+
+        # First frame holds the change back, every later one reports and retries it
+        results = [handler.process_hands([self.LEFT_OPEN, self.RIGHT_LEFT])[HandType.RIGHT] for _ in range(4)]
+        self.assertEqual(results, [CarAction.DIRECTION_STRAIGHT] + [CarAction.DIRECTION_LEFT] * 3)
+        self.assertEqual(send.call_args_list, [call(DIR_L)] * 3)
+
+    def test_stop_is_sent_without_confirmation(self):
+        """STOP is never debounced."""
+        send = self.mock_esp32.send_action
+        handler = self.make_handler(buffer_size=1)
+
+        handler.process_hands([self.LEFT_OPEN, self.RIGHT_STRAIGHT])
+        send.reset_mock()
+
+        actions = handler.process_hands([self.LEFT_CLOSED, self.RIGHT_STRAIGHT])
+        self.assertEqual(actions[HandType.LEFT], CarAction.STOP)
+        send.assert_called_once_with(STOP)
 
     def test_unchanged_action_resent_after_refresh_interval(self):
         """Test the keepalive: unchanged actions are resent once the refresh interval elapses."""
-        handler = CarHandler(self.mock_esp32, refresh_interval=0)
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        send = self.mock_esp32.send_action
+        handler = self.make_handler(refresh_interval=0)
 
-        handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 2)
+        handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 2)
 
         # Same state, but refresh_interval=0 means every call resends
-        handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 4)
+        handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 4)
 
     def test_failed_send_is_retried_until_success(self):
         """Test that actions keep being attempted while sending fails."""
-        self.mock_esp32.send_action.return_value = False
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        send = self.mock_esp32.send_action
+        send.return_value = False
 
-        self.handler.process_hands([left_hand_open])
-        self.handler.process_hands([left_hand_open])
+        self.handler.process_hands([self.LEFT_OPEN])
+        self.handler.process_hands([self.LEFT_OPEN])
         # Failed sends are not recorded as "last action", so both frames retry
-        self.assertEqual(self.mock_esp32.send_action.call_count, 4)
+        self.assertEqual(send.call_count, 4)
 
         # Once sending succeeds, the action is recorded and no longer resent
-        self.mock_esp32.send_action.return_value = True
-        self.handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 6)
-        self.handler.process_hands([left_hand_open])
-        self.assertEqual(self.mock_esp32.send_action.call_count, 6)
+        send.return_value = True
+        self.handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 6)
+        self.handler.process_hands([self.LEFT_OPEN])
+        self.assertEqual(send.call_count, 6)
 
     def test_get_action_is_read_only(self):
         """Test that get_action does not modify the action buffers."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-
-        action = self.handler.get_action(left_hand_open)
+        action = self.handler.get_action(self.LEFT_OPEN)
 
         self.assertEqual(action, CarAction.ACCELERATE)
         self.assertEqual(len(self.handler._action_buffers[HandType.LEFT]), 0)
 
     def test_record_action_populates_buffer(self):
         """Test that _record_action adds actions to the buffer and returns the correct action."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-
         # Initially buffer should be empty
         self.assertEqual(len(self.handler._action_buffers[HandType.LEFT]), 0)
 
-        action = self.handler._record_action(left_hand_open)
+        action = self.handler._record_action(self.LEFT_OPEN)
 
         # Buffer should now have one element and action should be correct
         self.assertEqual(len(self.handler._action_buffers[HandType.LEFT]), 1)
@@ -152,78 +220,62 @@ class TestCarHandler(unittest.TestCase):
 
     def test_unknown_hand_does_not_crash(self):
         """Test that UNKNOWN hands are handled without touching (missing) buffers."""
-        unknown_hand = self.create_mock_hand(HandType.UNKNOWN, is_open=True, orientation=IndexOrientation.STRAIGHT)
-
-        self.assertEqual(self.handler._record_action(unknown_hand), CarAction.STOP)
-        self.assertEqual(self.handler.get_action(unknown_hand), CarAction.STOP)
-        self.assertIsNone(self.handler._majority_action(unknown_hand))
+        self.assertEqual(self.handler._record_action(self.UNKNOWN_HAND), CarAction.STOP)
+        self.assertEqual(self.handler.get_action(self.UNKNOWN_HAND), CarAction.STOP)
+        self.assertIsNone(self.handler._majority_action(HandType.UNKNOWN))
 
     def test_stop_bypasses_majority_vote(self):
         """A STOP gesture takes effect immediately, even against an ACCELERATE majority."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        left_hand_closed = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
-
         # Fill the buffer with ACCELERATE
-        for _ in range(10):
-            self.handler._record_action(left_hand_open)
+        self._feed(self.handler, self.LEFT_OPEN, 10)
 
         # A single closed-hand frame must return STOP, not the majority
-        self.assertEqual(self.handler._record_action(left_hand_closed), CarAction.STOP)
+        self.assertEqual(self.handler._record_action(self.LEFT_CLOSED), CarAction.STOP)
         # The read-only path agrees
-        self.assertEqual(self.handler.get_action(left_hand_closed), CarAction.STOP)
+        self.assertEqual(self.handler.get_action(self.LEFT_CLOSED), CarAction.STOP)
 
     def test_accelerate_still_smoothed_by_majority(self):
         """Non-priority actions keep majority smoothing: one open frame can't override STOP."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        left_hand_closed = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
-
         # Fill the buffer with STOP
-        for _ in range(10):
-            self.handler._record_action(left_hand_closed)
+        self._feed(self.handler, self.LEFT_CLOSED, 10)
 
         # A single open-hand frame is outvoted by the STOP majority
-        action = self.handler._record_action(left_hand_open)
+        action = self.handler._record_action(self.LEFT_OPEN)
         self.assertEqual(action, CarAction.STOP)
 
     def test_buffer_respects_max_size(self):
         """Test that buffer doesn't exceed the specified max size."""
-        handler = CarHandler(self.mock_esp32, buffer_size=5)
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        buffer_size = 5
+        handler = self.make_handler(buffer_size=buffer_size)
 
-        # Add more actions than buffer size
-        for _ in range(10):
-            handler._record_action(left_hand_open)
+        # One action more than the buffer holds forces an eviction
+        self._feed(handler, self.LEFT_OPEN, buffer_size + 1)
 
         # Buffer should only contain buffer_size elements
-        self.assertEqual(len(handler._action_buffers[HandType.LEFT]), 5)
+        self.assertEqual(len(handler._action_buffers[HandType.LEFT]), buffer_size)
 
     def test_buffer_fifo_behavior(self):
         """Test that buffer uses FIFO (first in, first out) behavior."""
-        handler = CarHandler(self.mock_esp32, buffer_size=3)
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        left_hand_closed = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
+        handler = self.make_handler(buffer_size=3)
 
         # Add 2 STOP actions
-        handler._record_action(left_hand_closed)
-        handler._record_action(left_hand_closed)
+        handler._record_action(self.LEFT_CLOSED)
+        handler._record_action(self.LEFT_CLOSED)
 
         # Add 3 ACCELERATE actions (should push out the STOP actions)
-        handler._record_action(left_hand_open)
-        handler._record_action(left_hand_open)
-        action = handler._record_action(left_hand_open)
+        handler._record_action(self.LEFT_OPEN)
+        handler._record_action(self.LEFT_OPEN)
+        action = handler._record_action(self.LEFT_OPEN)
 
         # After buffer fills and old actions are pushed out, should return ACCELERATE
         self.assertEqual(action, CarAction.ACCELERATE)
 
     def test_separate_buffers_for_left_and_right_hands(self):
         """Test that left and right hands have separate buffers."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        right_hand_right = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.RIGHT)
-
         # Add actions for both hands
-        self.handler._record_action(left_hand_open)
-        self.handler._record_action(left_hand_open)
-        self.handler._record_action(right_hand_right)
+        self.handler._record_action(self.LEFT_OPEN)
+        self.handler._record_action(self.LEFT_OPEN)
+        self.handler._record_action(self.RIGHT_RIGHT)
 
         # Check buffers are independent
         self.assertEqual(len(self.handler._action_buffers[HandType.LEFT]), 2)
@@ -235,54 +287,49 @@ class TestCarHandler(unittest.TestCase):
 
     def test_get_action_uses_majority_when_available(self):
         """Test that get_action returns the majority action from the buffer."""
-        handler = CarHandler(self.mock_esp32, buffer_size=10)
-        right_hand_left = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.LEFT)
-        right_hand_straight = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.STRAIGHT)
+        handler = self.make_handler(buffer_size=10)
 
         # Fill buffer with mostly DIRECTION_LEFT actions
-        for _ in range(7):
-            handler._record_action(right_hand_left)
+        self._feed(handler, self.RIGHT_LEFT, 7)
         # Add fewer STRAIGHT actions
-        for _ in range(2):
-            handler._record_action(right_hand_straight)
+        self._feed(handler, self.RIGHT_STRAIGHT, 2)
 
         # Reading with a STRAIGHT gesture still returns the majority (DIRECTION_LEFT)
-        action = handler.get_action(right_hand_straight)
+        action = handler.get_action(self.RIGHT_STRAIGHT)
         self.assertEqual(action, CarAction.DIRECTION_LEFT)
 
     def test_action_confidence_reflects_buffer_share(self):
         """Test that get_action_confidence returns the winning action's buffer share."""
-        left_hand_open = self.create_mock_hand(HandType.LEFT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-        left_hand_closed = self.create_mock_hand(HandType.LEFT, is_open=False, orientation=IndexOrientation.STRAIGHT)
-
         # Empty buffer -> no confidence
         self.assertIsNone(self.handler.get_action_confidence(HandType.LEFT))
         # Unknown hand type has no buffer -> no confidence
         self.assertIsNone(self.handler.get_action_confidence(HandType.UNKNOWN))
 
         # 4 ACCELERATE + 1 STOP -> 80% confidence
-        for _ in range(4):
-            self.handler._record_action(left_hand_open)
-        self.handler._record_action(left_hand_closed)
+        self._feed(self.handler, self.LEFT_OPEN, 4)
+        self.handler._record_action(self.LEFT_CLOSED)
         self.assertEqual(self.handler.get_action_confidence(HandType.LEFT), 0.8)
 
+    def test_evicted_actions_stop_counting(self):
+        """Running counts follow the buffer window as old actions are evicted."""
+        handler = self.make_handler(buffer_size=3)
+
+        for hand in (self.LEFT_CLOSED, self.LEFT_CLOSED, self.LEFT_OPEN, self.LEFT_OPEN):
+            handler._record_action(hand)
+
+        # Window is now [STOP, ACCELERATE, ACCELERATE]
+        self.assertEqual(handler._majority_action(HandType.LEFT), CarAction.ACCELERATE)
+        self.assertAlmostEqual(handler.get_action_confidence(HandType.LEFT), 2 / 3)
+
     def test_right_hand_buffer_with_direction_changes(self):
         """Test buffering and majority for right hand direction changes."""
-        right_hand_left = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.LEFT)
-        right_hand_right = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.RIGHT)
-        right_hand_straight = self.create_mock_hand(HandType.RIGHT, is_open=True, orientation=IndexOrientation.STRAIGHT)
-
         # Add mixed directions with LEFT being majority
-        self.handler._record_action(right_hand_left)
-        self.handler._record_action(right_hand_left)
-        self.handler._record_action(right_hand_left)
-        self.handler._record_action(right_hand_right)
-        self.handler._record_action(right_hand_straight)
+        self.handler._record_action(self.RIGHT_LEFT)
+        self.handler._record_action(self.RIGHT_LEFT)
+        self.handler._record_action(self.RIGHT_LEFT)
+        self.handler._record_action(self.RIGHT_RIGHT)
+        self.handler._record_action(self.RIGHT_STRAIGHT)
 
         # Next action should be DIRECTION_LEFT (majority)
-        action = self.handler._record_action(right_hand_straight)
+        action = self.handler._record_action(self.RIGHT_STRAIGHT)
         self.assertEqual(action, CarAction.DIRECTION_LEFT)
-
-
-if __name__ == '__main__':
-    unittest.main()